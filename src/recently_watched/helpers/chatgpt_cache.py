@@ -0,0 +1,106 @@
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import functools
+from contextlib import closing
+from pathlib import Path
+from recently_watched.helpers.config_loader import load_config
+from recently_watched.helpers.logger import setup_logger
+
+config = load_config()
+logger = setup_logger("chatgpt_cache")
+
+# Go up from helpers/ -> recently_watched/ -> src/ -> project root -> data/
+CACHE_PATH = Path(__file__).resolve().parents[3] / "data" / "chatgpt_cache.sqlite3"
+# 0 disables the cache
+CACHE_TTL_DAYS = float(config.get("openai", {}).get("cache_ttl_days", 7))
+
+_YEAR_SUFFIX_RE = re.compile(r"\s*[\(\[]\d{4}[\)\]]\s*$")  # "Inception (2010)" -> "Inception"
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def normalize_movie_key(movie_name: str) -> str:
+    """
+    Fold casing, a trailing year and punctuation so that e.g.
+    "Inception", "inception (2010)" and "Inception!" share a cache entry.
+    """
+    s = _YEAR_SUFFIX_RE.sub("", movie_name.strip())
+    return _NON_WORD_RE.sub(" ", s.casefold()).strip()
+
+
+def _make_key(func_name: str, model: str, movie_name: str, max_results: int) -> str:
+    raw = f"{func_name}|{model}|{normalize_movie_key(movie_name)}|{max_results}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _connect():
+    conn = sqlite3.connect(str(CACHE_PATH), timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS recommendations ("
+        "key TEXT PRIMARY KEY, created REAL NOT NULL, titles TEXT NOT NULL)"
+    )
+    return conn
+
+
+def cache_get(key: str):
+    """
+    Return the cached title list for key, or None on a miss/expired entry.
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT created, titles FROM recommendations WHERE key = ?", (key,)
+            ).fetchone()
+    except Exception as e:
+        logger.warning(f"ChatGPT cache read failed: {e}")
+        return None
+    if not row:
+        return None
+    created, titles = row
+    if time.time() - created > CACHE_TTL_DAYS * 86400:
+        return None
+    try:
+        return json.loads(titles)
+    except (TypeError, ValueError) as e:
+        # Corrupt row: treat as a miss so the caller asks ChatGPT and overwrites it
+        logger.warning(f"ChatGPT cache entry unreadable: {e}")
+        return None
+
+
+def cache_put(key: str, titles):
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO recommendations (key, created, titles) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(titles, ensure_ascii=False)),
+            )
+    except Exception as e:
+        logger.warning(f"ChatGPT cache write failed: {e}")
+
+
+def cached_recommendations(model: str):
+    """
+    Decorator for recommenders with the signature (movie_name, max_results).
+    Non-empty results are stored on disk and reused for CACHE_TTL_DAYS,
+    skipping the OpenAI round-trip entirely on a hit.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(movie_name: str, max_results: int = 15):
+            if CACHE_TTL_DAYS <= 0:
+                return fn(movie_name, max_results)
+
+            key = _make_key(fn.__name__, model, movie_name, max_results)
+            hit = cache_get(key)
+            if hit is not None:
+                logger.info(f"ChatGPT cache hit for {fn.__name__}: {movie_name}")
+                return hit
+
+            result = fn(movie_name, max_results)
+            if result:
+                cache_put(key, result)
+            return result
+        return wrapper
+    return decorator
@@ -1,18 +1,70 @@
 import re
 from openai import OpenAI
 from recently_watched.helpers.config_loader import load_config
+from recently_watched.helpers.chatgpt_cache import cached_recommendations
+from recently_watched.helpers.throttle import TokenBucket
 
 config = load_config()
 client = OpenAI(api_key=config["openai"]["api_key"])
 
+MODEL = "gpt-5.2"
+
+_OPENAI_TB = TokenBucket(rate_per_sec=config["openai"].get("rps", 1.0), capacity=5)
+
+_NUM_PREFIX_RE = re.compile(r"^\d+\s*[.)\-]\s*")  # "1. Title" -> "Title"
+
 
 def normalize_title(line: str) -> str:
-    line = line.strip()
-    line = re.sub(r"^[\d]+\s*[\.\)\-]\s*", "", line)  # "1. Title" -> "Title"
-    line = line.strip("-• ").strip()
-    return line.strip()
+    return _NUM_PREFIX_RE.sub("", line.strip()).strip("-• \t\r\n")
+
+
+def _add_title(line: str, movies, seen):
+    t = normalize_title(line)
+    if not t:
+        return
+    tl = t.lower()
+    if tl in seen:
+        return
+    # Filter obvious fragments that cause Radarr failures
+    if len(t) < 3:
+        return
+    seen.add(tl)
+    movies.append(t)
+
+
+def _stream_titles(messages, temperature: float, max_results: int):
+    """
+    Stream the reply and parse titles line by line as they arrive.
+    Stops reading (and closes the stream) as soon as max_results titles are in.
+    """
+    _OPENAI_TB.acquire()
+    stream = client.chat.completions.create(
+        model=MODEL,
+        messages=messages,
+        temperature=temperature,
+        timeout=60,
+        stream=True,
+    )
+    movies = []
+    seen = set()
+    buf = ""
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            buf += chunk.choices[0].delta.content or ""
+            while "\n" in buf:
+                line, buf = buf.split("\n", 1)
+                _add_title(line, movies, seen)
+                if len(movies) >= max_results:
+                    return movies
+        _add_title(buf, movies, seen)
+    finally:
+        stream.close()
+    return movies[:max_results]
 
 
+@cached_recommendations(MODEL)
 def get_related_movies(movie_name: str, max_results: int = 15):
     prompt = (
         f"Suggest up to {max_results} movies related to '{movie_name}', "
@@ -24,34 +76,16 @@ def get_related_movies(movie_name: str, max_results: int = 15):
         "- No descriptions.\n"
     )
 
-
-    resp = client.chat.completions.create(
-        model="gpt-5.2",
-        messages=[
-            {"role": "system", "content": "You only output movie titles."}, 
+    return _stream_titles(
+        [
+            {"role": "system", "content": "You only output movie titles."},
             {"role": "user", "content": prompt},
         ],
         temperature=0.7,
-        timeout=60,   # <— add this
+        max_results=max_results,
     )
 
-    raw = resp.choices[0].message.content or ""
-    movies = []
-    seen = set()
-    for line in raw.splitlines():
-        t = normalize_title(line)
-        if not t:
-            continue
-        tl = t.lower()
-        if tl in seen:
-            continue
-        # Filter obvious fragments that cause Radarr failures
-        if len(t) < 3:
-            continue
-        seen.add(tl)
-        movies.append(t)
-    return movies[:max_results]
-
+@cached_recommendations(MODEL)
 def get_contrast_movies(movie_name: str, max_results: int = 15):
     """
     Return movies that feel like a 'palate cleanser' / opposite vibe of movie_name.
@@ -73,31 +107,15 @@ Rules:
 - One title per line, no numbering, no extra text.
 """.strip()
 
-    resp = client.chat.completions.create(
-        model="gpt-5.2",
-        messages=[
+    return _stream_titles(
+        [
             {"role": "system", "content": "You only output movie titles, one per line."},
             {"role": "user", "content": prompt},
         ],
         temperature=0.8,
-        timeout=60,   # <— add this
+        max_results=max_results,
     )
 
-    raw = resp.choices[0].message.content or ""
-    movies = []
-    seen = set()
-    for line in raw.splitlines():
-        t = normalize_title(line)
-        if not t:
-            continue
-        tl = t.lower()
-        if tl in seen:
-            continue
-        if len(t) < 3:
-            continue
-        seen.add(tl)
-        movies.append(t)
-    return movies[:max_results]
 
 if __name__ == "__main__":
     import sys
@@ -1,9 +1,17 @@
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+# libyaml-backed loader when PyYAML was built with it; much faster to parse
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
 def load_config():
     """
     Loads config.yaml from the project config/ directory.
+    The file is read once per process; every caller gets the same dict,
+    so treat it as read-only.
     """
     # Go up from helpers/ -> recently_watched/ -> src/ -> project root -> config/
     base_dir = Path(__file__).resolve().parents[3]
@@ -13,5 +21,4 @@ def load_config():
         raise FileNotFoundError(f"config.yaml not found at: {config_path}")
     
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
-
+        return yaml.load(f, Loader=_YAML_LOADER)
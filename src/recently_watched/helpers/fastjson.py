@@ -0,0 +1,47 @@
+"""
+JSON encode/decode backed by orjson when it is installed, stdlib json otherwise.
+Collection writers and the refresher both go through here so they stay in sync.
+"""
+
+import os
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+# Files are machine-read by the refresher, so output is compact by default.
+# Set PRETTY_JSON=1 to get indented output for debugging.
+PRETTY = os.environ.get("PRETTY_JSON", "") == "1"
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (compact unless PRETTY_JSON=1)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY else None)
+    if PRETTY:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_file(path, obj):
+    """
+    Write obj as JSON to path atomically: the data goes to a sibling .tmp
+    file first and is then moved over path with os.replace, so readers
+    never see a half-written file.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dumps(obj))
+    os.replace(tmp, path)
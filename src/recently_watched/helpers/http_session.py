@@ -0,0 +1,34 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from recently_watched.helpers.throttle import ThrottledSession
+
+# One connection pool shared by every helper session (Plex, Radarr, TMDB).
+# Sessions stay separate so per-service headers and rate limits don't mix,
+# but keep-alive sockets to each host are reused across all of them.
+SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+
+
+def make_session(headers=None, bucket=None):
+    """
+    Build a session on the shared keep-alive pool.
+    Idempotent requests are retried a few times on transient failures.
+    With a bucket, every request is paced through it.
+    """
+    session = ThrottledSession(bucket) if bucket else requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.mount("http://", SHARED_ADAPTER)
+    session.mount("https://", SHARED_ADAPTER)
+    return session
+
+
+def close_sessions():
+    """
+    Close all pooled connections. Safe to call more than once.
+    """
+    SHARED_ADAPTER.close()
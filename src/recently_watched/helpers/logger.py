@@ -15,3 +15,13 @@ def setup_logger(name="recent_watch", level=logging.INFO):
 
     return logger
 
+
+class PrefixLogger(logging.LoggerAdapter):
+    """
+    Prefixes every message with extra["prefix"], so output from jobs
+    running side by side on the same logger can be told apart.
+    """
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['prefix']}] {msg}", kwargs
+
@@ -1,6 +1,11 @@
+import time
+import threading
 from plexapi.server import PlexServer
 from recently_watched.helpers.config_loader import load_config
 from recently_watched.helpers.logger import setup_logger
+from recently_watched.helpers.throttle import TokenBucket
+from recently_watched.helpers.http_session import make_session
+from recently_watched.helpers.titles import title_key
 
 config = load_config()
 logger = setup_logger("plex")
@@ -9,21 +14,107 @@ PLEX_URL = config["plex"]["url"]
 PLEX_TOKEN = config["plex"]["token"]
 MOVIE_LIBRARY = config["plex"]["movie_library_name"]
 
-plex = PlexServer(PLEX_URL, PLEX_TOKEN)
+# Off by default: Plex is usually on the LAN and the refresher needs its full speed
+_PLEX_TB = TokenBucket(rate_per_sec=config["plex"].get("rps", 0), capacity=20)
+
+plex = PlexServer(PLEX_URL, PLEX_TOKEN, session=make_session(bucket=_PLEX_TB))
+
+_LIB = None
 
 
 def library():
-    return plex.library.section(MOVIE_LIBRARY)
+    """
+    Return the movie library section, looked up once and then reused.
+    """
+    global _LIB
+    if _LIB is None:
+        _LIB = plex.library.section(MOVIE_LIBRARY)
+    return _LIB
 
 
-def find_plex_movie_by_title(title):
-    logger.info(f"Searching Plex for: {title}")
-    for movie in library().search(title):
-        if movie.title.lower() == title.lower():
+# title_key() of "title" and "title (year)" -> Plex movie, rebuilt after the TTL
+LIBRARY_INDEX_TTL = 600  # seconds
+_library_index = None
+_library_index_built = 0.0
+_library_index_lock = threading.Lock()
+
+
+def build_plex_title_index():
+    """
+    Return {normalized title: movie} for the whole movie library.
+    Built from a single library listing and reused for LIBRARY_INDEX_TTL
+    seconds, so repeated lookups in the same process skip the rebuild.
+    Titles are keyed as "title" and "title (year)" for disambiguation.
+    """
+    global _library_index, _library_index_built
+    with _library_index_lock:
+        expired = time.monotonic() - _library_index_built > LIBRARY_INDEX_TTL
+        if _library_index is None or expired:
+            logger.info(f"Indexing Plex library: {MOVIE_LIBRARY}")
+            index = {}
+            for movie in library().all():
+                title_l = title_key(movie.title)
+                index.setdefault(title_l, movie)
+                year = getattr(movie, "year", None)
+                if year:
+                    index.setdefault(f"{title_l} ({year})", movie)
+            _library_index = index
+            _library_index_built = time.monotonic()
+            logger.info(f"Indexed {len(index)} Plex titles")
+        return _library_index
+
+
+def refresh_library_index():
+    """
+    Drop the cached library index so the next lookup rebuilds it.
+    Call this after movies are added to or renamed in Plex.
+    """
+    global _library_index
+    with _library_index_lock:
+        _library_index = None
+
+
+def _resolve_title(title, index):
+    """
+    Look a title up in the library index, falling back to a Plex search
+    for titles the index doesn't know (e.g. added since it was built).
+    """
+    title_l = title_key(title)
+    movie = index.get(title_l)
+    if movie:
+        return movie
+
+    # Index may be stale; ask Plex directly, filtered to movies server-side
+    for movie in library().search(title=title, libtype="movie"):
+        if title_key(movie.title) == title_l:
+            # Plex has it but the index doesn't, so rebuild on the next lookup
+            refresh_library_index()
             return movie
     return None
 
 
+def find_plex_movie_by_title(title):
+    logger.info(f"Searching Plex for: {title}")
+    return _resolve_title(title, build_plex_title_index())
+
+
+def find_plex_movies_by_titles(titles):
+    """
+    Resolve many titles against the library index in one pass.
+    Returns {title: plex_movie} for the titles found; misses are left out.
+    Only the first call pays for the library download; index misses
+    fall back to a search each, same as find_plex_movie_by_title.
+    """
+    index = build_plex_title_index()
+    found = {}
+    for title in titles:
+        movie = _resolve_title(title, index)
+        if movie:
+            found[title] = movie
+    logger.info(f"Matched {len(found)}/{len(titles)} titles against the Plex library")
+    return found
+
+
 def clear_collection(collection_name: str):
     """
     Remove the collection tag from every movie currently in that collection.
@@ -72,16 +163,17 @@ def remove_movie_from_collection(movie, collection_name: str):
         movie.removeCollection(collection_name)
         return
 
+    target = collection_name.lower()
     if hasattr(movie, "editTags"):
         # remove only this tag by re-setting without it
         current = [c.tag for c in getattr(movie, "collections", [])] or []
-        new_list = [c for c in current if c.lower() != collection_name.lower()]
+        new_list = [c for c in current if c.lower() != target]
         movie.editTags("collection", new_list, locked=False)
         return
 
     # last resort: attempt edit
     current = [c.tag for c in getattr(movie, "collections", [])] or []
-    new_list = [c for c in current if c.lower() != collection_name.lower()]
+    new_list = [c for c in current if c.lower() != target]
     try:
         movie.edit(collections=new_list)
     except Exception as e:
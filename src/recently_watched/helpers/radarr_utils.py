@@ -1,6 +1,9 @@
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from recently_watched.helpers.config_loader import load_config
 from recently_watched.helpers.logger import setup_logger
+from recently_watched.helpers.throttle import TokenBucket
+from recently_watched.helpers.http_session import make_session
 
 config = load_config()
 logger = setup_logger("radarr")
@@ -12,40 +15,114 @@ TMDB_API_KEY = config["tmdb"]["api_key"]
 
 HEADERS = {"X-Api-Key": RADARR_API_KEY}
 
+# Kept low so a batch of missing titles doesn't hammer Radarr
+RADARR_WORKERS = 4
+
+_RADARR_TB = TokenBucket(rate_per_sec=config["radarr"].get("rps", 5.0), capacity=10)
+
+_sess = make_session(HEADERS, _RADARR_TB)
+_tmdb = make_session()
+
+
+# Tag label (lowercased) -> Radarr tag id, filled as tags are resolved
+_tag_ids = {}
+_tag_lock = threading.Lock()
+
+# Guards the tmdbId duplicate check + POST in radarr_add_and_search
+_add_lock = threading.Lock()
+
 
 def get_or_create_tag(tag_name: str) -> int:
-    r = requests.get(f"{RADARR_URL}/api/v3/tag", headers=HEADERS)
-    r.raise_for_status()
-    for tag in r.json():
-        if tag["label"].lower() == tag_name.lower():
-            return tag["id"]
-
-    logger.info(f"Creating Radarr tag: {tag_name}")
-    r = requests.post(
-        f"{RADARR_URL}/api/v3/tag",
-        json={"label": tag_name},
-        headers=HEADERS,
-    )
-    r.raise_for_status()
-    return r.json()["id"]
+    key = tag_name.lower()
+    with _tag_lock:
+        if key in _tag_ids:
+            return _tag_ids[key]
+
+        r = _sess.get(f"{RADARR_URL}/api/v3/tag")
+        r.raise_for_status()
+        for tag in r.json():
+            if tag["label"].lower() == key:
+                _tag_ids[key] = tag["id"]
+                return tag["id"]
+
+        logger.info(f"Creating Radarr tag: {tag_name}")
+        r = _sess.post(
+            f"{RADARR_URL}/api/v3/tag",
+            json={"label": tag_name},
+        )
+        r.raise_for_status()
+        _tag_ids[key] = r.json()["id"]
+        return _tag_ids[key]
 
 
 def _radarr_get_all_movies():
-    r = requests.get(f"{RADARR_URL}/api/v3/movie", headers=HEADERS)
+    r = _sess.get(f"{RADARR_URL}/api/v3/movie")
     r.raise_for_status()
     return r.json()
 
 
+class RadarrCache:
+    """
+    In-memory index of the Radarr library, filled by a single GET /movie.
+    Lookups by title (case-insensitive) and tmdbId are dict probes.
+    Entries are updated in place when this module adds or edits a movie.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.by_title = {}
+        self.by_tmdb = {}
+
+    def load(self, force: bool = False):
+        with self._lock:
+            if self.loaded and not force:
+                return
+            by_title = {}
+            by_tmdb = {}
+            for movie in _radarr_get_all_movies():
+                # setdefault keeps the first match, like the old linear scan
+                by_title.setdefault(movie.get("title", "").lower(), movie)
+                tmdb_id = movie.get("tmdbId")
+                if tmdb_id:
+                    by_tmdb.setdefault(int(tmdb_id), movie)
+            self.by_title = by_title
+            self.by_tmdb = by_tmdb
+            self.loaded = True
+            logger.debug("Loaded %d Radarr movies into cache", len(by_tmdb))
+
+    def put(self, movie):
+        with self._lock:
+            if not self.loaded:
+                return
+            self.by_title[movie.get("title", "").lower()] = movie
+            tmdb_id = movie.get("tmdbId")
+            if tmdb_id:
+                self.by_tmdb[int(tmdb_id)] = movie
+
+    def invalidate(self):
+        with self._lock:
+            self.loaded = False
+
+    def find_by_title(self, title: str):
+        self.load()
+        return self.by_title.get(title.lower())
+
+    def find_by_tmdb_id(self, tmdb_id):
+        self.load()
+        # Keys are ints; TMDB/lookup payloads sometimes carry the id as a string
+        return self.by_tmdb.get(int(tmdb_id))
+
+
+_cache = RadarrCache()
+
+
 def radarr_find_movie(title: str):
     """
     Returns the Radarr movie dict if title matches (case-insensitive), else None.
     Mirrors your existing title matching behavior.
     """
-    title_l = title.lower()
-    for movie in _radarr_get_all_movies():
-        if movie.get("title", "").lower() == title_l:
-            return movie
-    return None
+    return _cache.find_by_title(title)
 
 
 def radarr_movie_exists(title: str) -> bool:
@@ -66,16 +143,16 @@ def radarr_set_monitored(movie, monitored: bool = True):
     updated["monitored"] = monitored
 
     logger.info(f"Setting monitored={monitored} in Radarr: {movie.get('title')}")
-    r = requests.put(
+    r = _sess.put(
         f"{RADARR_URL}/api/v3/movie/{movie_id}",
         json=updated,
-        headers=HEADERS,
     )
     r.raise_for_status()
+    _cache.put(updated)
 
 
 def search_tmdb(title: str):
-    r = requests.get(
+    r = _tmdb.get(
         "https://api.themoviedb.org/3/search/movie",
         params={"api_key": TMDB_API_KEY, "query": title},
         timeout=30,
@@ -86,6 +163,13 @@ def search_tmdb(title: str):
 
 
 def radarr_add_and_search(title: str, tag_names):
+    # Already in Radarr under this title: no lookup needed
+    existing = radarr_find_movie(title)
+    if existing:
+        logger.info(f"Already in Radarr by title: {existing.get('title')} -> forcing monitored")
+        radarr_set_monitored(existing, True)
+        return
+
     tag_ids = [get_or_create_tag(t) for t in tag_names]
 
     looked_up = None
@@ -111,13 +195,6 @@ def radarr_add_and_search(title: str, tag_names):
         logger.warning(f"No tmdbId resolved for: {title}")
         return
 
-    # ✅ NEW: prevent duplicate adds
-    existing_by_id = radarr_find_movie_by_tmdb_id(int(tmdb_id))
-    if existing_by_id:
-        logger.info(f"Already in Radarr by tmdbId: {existing_by_id.get('title')} -> forcing monitored")
-        radarr_set_monitored(existing_by_id, True)
-        return
-
     payload = {
         "title": resolved_title,
         "tmdbId": int(tmdb_id),
@@ -129,29 +206,117 @@ def radarr_add_and_search(title: str, tag_names):
         "tags": tag_ids,
     }
 
-    logger.info(f"Adding movie to Radarr + searching: {resolved_title}")
-    r = requests.post(f"{RADARR_URL}/api/v3/movie", json=payload, headers=HEADERS)
+    # Two titles in one batch can resolve to the same tmdbId; check and add
+    # under one lock so the second worker finds the first one's cached add
+    with _add_lock:
+        # Prevent duplicate adds (cache probe, no extra request)
+        existing_by_id = radarr_find_movie_by_tmdb_id(int(tmdb_id))
+        if existing_by_id:
+            logger.info(f"Already in Radarr by tmdbId: {existing_by_id.get('title')} -> forcing monitored")
+            radarr_set_monitored(existing_by_id, True)
+            return
+
+        logger.info(f"Adding movie to Radarr + searching: {resolved_title}")
+        r = _sess.post(f"{RADARR_URL}/api/v3/movie", json=payload)
+        r.raise_for_status()
+        try:
+            _cache.put(r.json())
+        except ValueError:
+            # No usable body; make the next lookup refetch the library
+            _cache.invalidate()
+
+
+def radarr_set_monitored_bulk(movies, monitored: bool = True):
+    """
+    Set monitored on many Radarr movies with a single PUT /movie/editor call.
+    Movies already in the requested state are skipped.
+    """
+    pending = []
+    for movie in movies:
+        if movie.get("monitored") is monitored:
+            logger.info(f"Already monitored in Radarr: {movie.get('title')}")
+        else:
+            pending.append(movie)
+    if not pending:
+        return
+
+    logger.info(f"Setting monitored={monitored} in Radarr for {len(pending)} movies")
+    r = _sess.put(
+        f"{RADARR_URL}/api/v3/movie/editor",
+        json={"movieIds": [m["id"] for m in pending], "monitored": monitored},
+    )
     r.raise_for_status()
+    for movie in pending:
+        updated = dict(movie)
+        updated["monitored"] = monitored
+        _cache.put(updated)
+
+
+def _add_one(title: str, tag_names):
+    try:
+        radarr_add_and_search(title, tag_names)
+    except Exception as e:
+        logger.error(f"Failed to add/search in Radarr for {title}: {e}")
+
+
+# Both collection pipelines can call radarr_process_missing_titles at once
+_process_lock = threading.Lock()
 
 
 def radarr_process_missing_titles(titles, tag_names):
     """
     For each title:
-      - if exists in Radarr -> force monitored=True
-      - else add + search
+      - if exists in Radarr -> force monitored=True (one bulk editor request)
+      - else add + search (independent titles, processed on a small worker pool)
+    Calls are serialized: a concurrent batch could otherwise POST the same
+    movie, and the second caller should instead see it and mark it monitored.
     """
+    if not titles:
+        return
+
+    with _process_lock:
+        _process_missing_titles(titles, tag_names)
+
+
+def _process_missing_titles(titles, tag_names):
+    # One library download for the whole batch instead of one per title
+    _cache.load(force=True)
+
+    existing = []
+    to_add = []
     for title in titles:
-        existing = radarr_find_movie(title)
-        if existing:
-            try:
-                radarr_set_monitored(existing, True)
-            except Exception as e:
-                logger.error(f"Failed to set monitored for {title}: {e}")
+        movie = radarr_find_movie(title)
+        if movie:
+            existing.append(movie)
         else:
+            to_add.append(title)
+
+    if existing:
+        try:
+            radarr_set_monitored_bulk(existing, True)
+        except Exception as e:
+            # Older Radarr builds may lack the editor endpoint; go one by one
+            logger.warning(f"Bulk monitor update failed, retrying per movie: {e}")
+            for movie in existing:
+                try:
+                    radarr_set_monitored(movie, True)
+                except Exception as e2:
+                    logger.error(f"Failed to set monitored for {movie.get('title')}: {e2}")
+
+    if not to_add:
+        return
+
+    # Create any missing tags up front so workers don't race to create them
+    for tag_name in tag_names:
+        get_or_create_tag(tag_name)
+
+    with ThreadPoolExecutor(max_workers=RADARR_WORKERS) as ex:
+        futures = {ex.submit(_add_one, title, tag_names): title for title in to_add}
+        for future, title in futures.items():
             try:
-                radarr_add_and_search(title, tag_names)
+                future.result()
             except Exception as e:
-                logger.error(f"Failed to add/search in Radarr for {title}: {e}")
+                logger.error(f"Radarr processing failed for {title}: {e}")
 
 
 def radarr_lookup_movie(title: str):
@@ -159,9 +324,8 @@ def radarr_lookup_movie(title: str):
     Uses Radarr's lookup endpoint to find a movie and return a suitable object
     (includes tmdbId and title). This avoids doing TMDB DNS from the script host.
     """
-    r = requests.get(
+    r = _sess.get(
         f"{RADARR_URL}/api/v3/movie/lookup",
-        headers=HEADERS,
         params={"term": title},
         timeout=30,
     )
@@ -169,9 +333,10 @@ def radarr_lookup_movie(title: str):
     results = r.json()
     return results[0] if results else None
 
+
 def radarr_find_movie_by_tmdb_id(tmdb_id: int):
-    for movie in _radarr_get_all_movies():
-        if movie.get("tmdbId") == tmdb_id:
-            return movie
-    return None
+    """
+    Returns the Radarr movie dict with this tmdbId, else None (O(1) cache probe).
+    """
+    return _cache.find_by_tmdb_id(tmdb_id)
 
@@ -1,30 +1,33 @@
 import sys
-import json
 from pathlib import Path
 from recently_watched.helpers.chatgpt_utils import get_contrast_movies
 from recently_watched.helpers.radarr_utils import radarr_process_missing_titles
-from recently_watched.helpers.plex_utils import find_plex_movie_by_title
-from recently_watched.helpers.logger import setup_logger
-
-logger = setup_logger("change_of_taste")
+from recently_watched.helpers.plex_utils import find_plex_movies_by_titles
+from recently_watched.helpers.logger import setup_logger, PrefixLogger
+from recently_watched.helpers import fastjson
+from recently_watched.helpers.titles import title_key
 
 RADARR_TAGS = ["movies", "change-of-taste"]
 COLLECTION_NAME = "Change of Taste"
 JSON_FILE = "change_of_taste_collection.json"
 
+# Runs alongside the Recently Watched pipeline; prefix lines to tell them apart
+logger = PrefixLogger(setup_logger("change_of_taste"), {"prefix": COLLECTION_NAME})
+
+# Go up from helpers/ -> recently_watched/ -> src/ -> project root -> data/
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
 
 def save_collection_to_json(movies, json_file):
     """
     Save collection movies to JSON file.
     Movies should be a list of dicts with 'title' and optionally 'rating_key'.
     """
-    # Go up from helpers/ -> recently_watched/ -> src/ -> project root -> data/
-    project_root = Path(__file__).resolve().parents[3]
-    json_path = project_root / "data" / json_file
+    json_path = DATA_DIR / json_file
     
     try:
-        with open(str(json_path), "w", encoding="utf-8") as f:
-            json.dump(movies, f, indent=2, ensure_ascii=False)
+        fastjson.write_file(json_path, movies)
         logger.info(f"Saved {len(movies)} movies to {json_file}")
     except Exception as e:
         logger.exception(f"Failed to save collection to {json_file}: {e}")
@@ -43,47 +46,50 @@ def run_change_of_taste_collection(movie_name: str, max_results: int = 15):
         logger.info("Step 1: Getting contrast recommendations from ChatGPT...")
         recommendations = get_contrast_movies(movie_name, max_results=max_results)
         logger.info(f"  ✓ ChatGPT returned {len(recommendations)} contrast recommendations")
+        if not recommendations:
+            logger.warning("No recommendations returned; skipping downstream steps")
+            return {
+                "found_in_plex": 0,
+                "missing_in_plex": 0,
+                "saved_to_json": False,
+                "sent_to_radarr": 0,
+            }
+
+        # Deduplicate by normalized title before any Plex/Radarr lookups,
+        # so each distinct title costs at most one lookup (preserve order)
+        unique = {}
+        for t in recommendations:
+            stripped = t.strip()
+            if stripped:
+                unique.setdefault(title_key(stripped), stripped)
+        recommendations = list(unique.values())
 
         collection_movies = []
-        missing_in_plex = []
-        missing_seen = set()
+        # normalized key -> title, in recommendation order
+        missing_in_plex = {}
 
         # 1) Plex-first pass
         logger.info("Step 2: Checking movies in Plex...")
-        for title in recommendations:
-            try:
-                plex_movie = find_plex_movie_by_title(title)
-                if plex_movie:
-                    # Store with rating key for faster lookup later
-                    collection_movies.append({
-                        "title": plex_movie.title,
-                        "rating_key": str(plex_movie.ratingKey),
-                        "year": getattr(plex_movie, "year", None),
-                    })
-                else:
-                    logger.debug(f"  Missing in Plex: {title}")
-                    key = title.strip().lower()
-                    if key and key not in missing_seen:
-                        missing_seen.add(key)
-                        missing_in_plex.append(title.strip())
-            except Exception as e:
-                logger.warning(f"  Error checking '{title}' in Plex: {e}")
-                # Continue processing other movies
-                key = title.strip().lower()
-                if key and key not in missing_seen:
-                    missing_seen.add(key)
-                    missing_in_plex.append(title.strip())
-
-        # 2) Deduplicate missing list (preserve order)
-        deduped = []
-        seen = set()
-        for t in missing_in_plex:
-            tl = t.lower()
-            if tl in seen:
-                continue
-            seen.add(tl)
-            deduped.append(t)
-        missing_in_plex = deduped
+        try:
+            # One library listing + in-memory matching instead of a search per title
+            found = find_plex_movies_by_titles(recommendations)
+        except Exception as e:
+            logger.warning(f"  Error checking titles in Plex: {e}")
+            # Treat everything as missing and continue
+            found = {}
+
+        for key, title in unique.items():
+            plex_movie = found.get(title)
+            if plex_movie:
+                # Store with rating key for faster lookup later
+                collection_movies.append({
+                    "title": plex_movie.title,
+                    "rating_key": int(plex_movie.ratingKey),
+                    "year": plex_movie.year,
+                })
+            else:
+                logger.debug("  Missing in Plex: %s", title)
+                missing_in_plex[key] = title
 
         logger.info(f"  ✓ Found {len(collection_movies)} movies in Plex")
         logger.info(f"  ✓ {len(missing_in_plex)} movies missing in Plex")
@@ -102,12 +108,12 @@ def run_change_of_taste_collection(movie_name: str, max_results: int = 15):
         else:
             logger.warning(f"Step 3: No movies found in Plex to save to collection")
 
-        # 3) Radarr processing for missing titles
+        # 2) Radarr processing for missing titles
         sent_to_radarr = 0
         if missing_in_plex:
             logger.info(f"Step 4: Processing {len(missing_in_plex)} missing movies in Radarr...")
             try:
-                radarr_process_missing_titles(missing_in_plex, RADARR_TAGS)
+                radarr_process_missing_titles(list(missing_in_plex.values()), RADARR_TAGS)
                 sent_to_radarr = len(missing_in_plex)
                 logger.info(f"  ✓ Processed {len(missing_in_plex)} movies in Radarr")
             except Exception as e:
@@ -0,0 +1,47 @@
+import time
+import threading
+import requests
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() blocks until a token is available,
+    so concurrent workers are paced at rate_per_sec (with bursts up to
+    capacity) instead of running into 429s and retry backoff.
+    A rate of 0 or less disables throttling.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = float(rate_per_sec)
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait = (n - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ThrottledSession(requests.Session):
+    """
+    requests.Session that takes a token from bucket before every request.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        super().__init__()
+        self.bucket = bucket
+
+    def request(self, *args, **kwargs):
+        self.bucket.acquire()
+        return super().request(*args, **kwargs)
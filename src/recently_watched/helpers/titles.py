@@ -0,0 +1,14 @@
+import unicodedata
+
+
+def title_key(title: str) -> str:
+    """
+    Normalized lookup/dedupe key for a movie title.
+    ASCII titles (the common case) just get strip().lower(); anything else
+    is NFC-normalized and casefolded so "Amélie" matches in either
+    composed or decomposed form.
+    """
+    title = title.strip()
+    if title.isascii():
+        return title.lower()
+    return unicodedata.normalize("NFC", title).casefold()
@@ -1,33 +1,39 @@
 import sys
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from recently_watched.helpers.chatgpt_utils import get_related_movies
-from recently_watched.helpers.radarr_utils import radarr_process_missing_titles
-from recently_watched.helpers.plex_utils import find_plex_movie_by_title
-from recently_watched.helpers.logger import setup_logger
+from recently_watched.helpers.logger import setup_logger, PrefixLogger
+from recently_watched.helpers import fastjson
 from recently_watched.helpers.config_loader import load_config
-from recently_watched.helpers.tautulli_change_of_taste_collection import run_change_of_taste_collection
+from recently_watched.helpers.titles import title_key
+
+# The OpenAI/Plex/Radarr helpers are imported where they are used: importing
+# them creates API clients and connects to Plex, which the usage/argument
+# error paths don't need.
 
 logger = setup_logger("recent_watch")
+# Runs alongside the Change of Taste pipeline; prefix lines to tell them apart
+_pipeline_logger = PrefixLogger(logger, {"prefix": "Recently Watched"})
 
 RADARR_TAGS = ["movies", "due-to-previously-watched"]
 COLLECTION_NAME = "Based on your recently watched movie"
 JSON_FILE = "recently_watched_collection.json"
 
+# Go up from main.py -> recently_watched/ -> src/ -> project root
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+
 
 def save_collection_to_json(movies, json_file):
     """
     Save collection movies to JSON file.
     Movies should be a list of dicts with 'title' and optionally 'rating_key'.
     """
-    # Go up from main.py -> recently_watched/ -> src/ -> project root -> data/
-    project_root = Path(__file__).resolve().parents[2]
-    json_path = project_root / "data" / json_file
+    json_path = DATA_DIR / json_file
     
     try:
-        with open(str(json_path), "w", encoding="utf-8") as f:
-            json.dump(movies, f, indent=2, ensure_ascii=False)
+        fastjson.write_file(json_path, movies)
         logger.info(f"Saved {len(movies)} movies to {json_file}")
     except Exception as e:
         logger.exception(f"Failed to save collection to {json_file}: {e}")
@@ -39,6 +45,11 @@ def run_recently_watched_playlist(movie_name):
     Process recently watched movie and generate recommendations.
     Returns dict with stats: {"found_in_plex", "missing_in_plex", "saved_to_json", "sent_to_radarr"}
     """
+    from recently_watched.helpers.chatgpt_utils import get_related_movies
+    from recently_watched.helpers.radarr_utils import radarr_process_missing_titles
+    from recently_watched.helpers.plex_utils import find_plex_movies_by_titles
+
+    logger = _pipeline_logger
     logger.info(f"Processing movie: {movie_name}")
     
     try:
@@ -46,46 +57,61 @@ def run_recently_watched_playlist(movie_name):
         logger.info("Step 1: Getting recommendations from ChatGPT...")
         recommendations = get_related_movies(movie_name, max_results=15)
         logger.info(f"  ✓ ChatGPT returned {len(recommendations)} recommendations")
+        if not recommendations:
+            logger.warning("No recommendations returned; skipping downstream steps")
+            return {
+                "found_in_plex": 0,
+                "missing_in_plex": 0,
+                "saved_to_json": False,
+                "sent_to_radarr": 0,
+            }
+
+        # Deduplicate by normalized title before any Plex/Radarr lookups,
+        # so each distinct title costs at most one lookup (preserve order)
+        unique = {}
+        for t in recommendations:
+            stripped = t.strip()
+            if stripped:
+                unique.setdefault(title_key(stripped), stripped)
+        recommendations = list(unique.values())
         
         collection_movies = []
-        missing_in_plex = []
-        missing_seen = set()
+        # normalized key -> title, in recommendation order
+        missing_in_plex = {}
 
-        # Plex-first pass (single loop)
+        # Plex-first pass against a single library listing
         logger.info("Step 2: Checking movies in Plex...")
-        for title in recommendations:
-            try:
-                plex_movie = find_plex_movie_by_title(title)
-                if plex_movie:
-                    # Store with rating key for faster lookup later
-                    collection_movies.append({
-                        "title": plex_movie.title,
-                        "rating_key": str(plex_movie.ratingKey),
-                        "year": getattr(plex_movie, "year", None),
-                    })
-                else:
-                    logger.debug(f"  Missing in Plex: {title}")
-                    key = title.strip().lower()
-                    if key and key not in missing_seen:
-                        missing_seen.add(key)
-                        missing_in_plex.append(title.strip())
-            except Exception as e:
-                logger.warning(f"  Error checking '{title}' in Plex: {e}")
-                # Continue processing other movies
-                key = title.strip().lower()
-                if key and key not in missing_seen:
-                    missing_seen.add(key)
-                    missing_in_plex.append(title.strip())
+        try:
+            found = find_plex_movies_by_titles(recommendations)
+        except Exception as e:
+            logger.warning(f"  Error checking titles in Plex: {e}")
+            # Treat everything as missing and continue
+            found = {}
+
+        for key, title in unique.items():
+            plex_movie = found.get(title)
+            if plex_movie:
+                # Store with rating key for faster lookup later
+                collection_movies.append({
+                    "title": plex_movie.title,
+                    "rating_key": int(plex_movie.ratingKey),
+                    "year": plex_movie.year,
+                })
+            else:
+                logger.debug("  Missing in Plex: %s", title)
+                missing_in_plex[key] = title
 
-        logger.info(f"  ✓ Found {len(collection_movies)} movies in Plex")
-        logger.info(f"  ✓ {len(missing_in_plex)} movies missing in Plex")
+        n_found = len(collection_movies)
+        n_missing = len(missing_in_plex)
+        logger.info(f"  ✓ Found {n_found} movies in Plex")
+        logger.info(f"  ✓ {n_missing} movies missing in Plex")
 
         # Save to JSON (will be applied to Plex by midnight script)
         saved_to_json = False
         if collection_movies:
             try:
                 save_collection_to_json(collection_movies, JSON_FILE)
-                logger.info(f"Step 3: Saved {len(collection_movies)} movies to {JSON_FILE}")
+                logger.info(f"Step 3: Saved {n_found} movies to {JSON_FILE}")
                 logger.info(f"  ✓ Collection state saved (will be applied by midnight refresher)")
                 saved_to_json = True
             except Exception as e:
@@ -97,11 +123,11 @@ def run_recently_watched_playlist(movie_name):
         # Radarr processing for missing titles
         sent_to_radarr = 0
         if missing_in_plex:
-            logger.info(f"Step 4: Processing {len(missing_in_plex)} missing movies in Radarr...")
+            logger.info(f"Step 4: Processing {n_missing} missing movies in Radarr...")
             try:
-                radarr_process_missing_titles(missing_in_plex, RADARR_TAGS)
-                sent_to_radarr = len(missing_in_plex)
-                logger.info(f"  ✓ Processed {len(missing_in_plex)} movies in Radarr")
+                radarr_process_missing_titles(list(missing_in_plex.values()), RADARR_TAGS)
+                sent_to_radarr = n_missing
+                logger.info(f"  ✓ Processed {n_missing} movies in Radarr")
             except Exception as e:
                 logger.error(f"  ✗ Error processing movies in Radarr: {e}")
                 # Don't raise - continue execution
@@ -110,8 +136,8 @@ def run_recently_watched_playlist(movie_name):
             logger.info(f"Step 4: No missing movies to process in Radarr")
         
         return {
-            "found_in_plex": len(collection_movies),
-            "missing_in_plex": len(missing_in_plex),
+            "found_in_plex": n_found,
+            "missing_in_plex": n_missing,
             "saved_to_json": saved_to_json,
             "sent_to_radarr": sent_to_radarr,
         }
@@ -120,6 +146,24 @@ def run_recently_watched_playlist(movie_name):
         raise
 
 
+def _run_change_of_taste_collection(movie_name):
+    from recently_watched.helpers.tautulli_change_of_taste_collection import run_change_of_taste_collection
+    return run_change_of_taste_collection(movie_name, max_results=15)
+
+
+def _warm_plex_index():
+    """
+    Build the Plex library index in the background so the library download
+    overlaps with the ChatGPT calls instead of starting after them.
+    Failures are left for the pipelines to hit and report themselves.
+    """
+    from recently_watched.helpers.plex_utils import build_plex_title_index
+    try:
+        build_plex_title_index()
+    except Exception as e:
+        logger.warning(f"Background Plex index build failed: {e}")
+
+
 def main():
     """
     Main entry point for the Recently Watched Collection script.
@@ -167,54 +211,60 @@ def main():
             logger.info(f"    → Or set 'run_collection_refresher: true' in config/config.yaml")
         logger.info("")
         
-        # Process recently watched collection
-        logger.info("Processing 'Based on your recently watched movie' collection...")
+        # Process both collections concurrently; they only share thread-safe
+        # helpers (Plex index, Radarr cache, HTTP pool) and write separate files.
+        # The Plex index is warmed alongside so it is ready when ChatGPT returns.
+        logger.info("Processing 'Based on your recently watched movie' and 'Change of Taste' collections...")
         logger.info("-" * 60)
         stats_recent = None
-        try:
-            stats_recent = run_recently_watched_playlist(movie_name)
-            logger.info("-" * 60)
-            logger.info(f"✓ Recently watched collection processed successfully")
-        except Exception as e:
-            logger.error(f"✗ Error processing recently watched collection: {e}")
-            logger.exception("Full traceback:")
-            exit_code = 1
-        
-        logger.info("")
-        
-        # Process change of taste collection
-        logger.info("Processing 'Change of Taste' collection...")
-        logger.info("-" * 60)
         stats_change = None
-        try:
-            stats_change = run_change_of_taste_collection(movie_name, max_results=15)
-            logger.info("-" * 60)
-            logger.info(f"✓ Change of taste collection processed successfully")
-        except Exception as e:
-            logger.error(f"✗ Error processing change of taste collection: {e}")
-            logger.exception("Full traceback:")
-            exit_code = 1
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            ex.submit(_warm_plex_index)
+            future_recent = ex.submit(run_recently_watched_playlist, movie_name)
+            future_change = ex.submit(_run_change_of_taste_collection, movie_name)
+
+            try:
+                stats_recent = future_recent.result()
+                logger.info(f"✓ Recently watched collection processed successfully")
+            except Exception as e:
+                logger.error(f"✗ Error processing recently watched collection: {e}")
+                logger.exception("Full traceback:")
+                exit_code = 1
+
+            try:
+                stats_change = future_change.result()
+                logger.info(f"✓ Change of taste collection processed successfully")
+            except Exception as e:
+                logger.error(f"✗ Error processing change of taste collection: {e}")
+                logger.exception("Full traceback:")
+                exit_code = 1
+        logger.info("-" * 60)
         
         # Final summary
         elapsed_time = time.time() - script_start_time
-        logger.info("")
-        logger.info("=" * 60)
-        logger.info("RECENTLY WATCHED COLLECTION SCRIPT SUMMARY")
-        logger.info("=" * 60)
-        if stats_recent:
-            logger.info(f"Recently Watched Collection:")
-            logger.info(f"  - Found in Plex: {stats_recent.get('found_in_plex', 0)}")
-            logger.info(f"  - Missing in Plex: {stats_recent.get('missing_in_plex', 0)}")
-            logger.info(f"  - Saved to JSON: {'✓' if stats_recent.get('saved_to_json') else '✗'}")
-            logger.info(f"  - Sent to Radarr: {stats_recent.get('sent_to_radarr', 0)}")
-        if stats_change:
-            logger.info(f"Change of Taste Collection:")
-            logger.info(f"  - Found in Plex: {stats_change.get('found_in_plex', 0)}")
-            logger.info(f"  - Missing in Plex: {stats_change.get('missing_in_plex', 0)}")
-            logger.info(f"  - Saved to JSON: {'✓' if stats_change.get('saved_to_json') else '✗'}")
-            logger.info(f"  - Sent to Radarr: {stats_change.get('sent_to_radarr', 0)}")
-        logger.info(f"Total execution time: {elapsed_time:.1f} seconds")
-        logger.info("=" * 60)
+        lines = [
+            "",
+            "=" * 60,
+            "RECENTLY WATCHED COLLECTION SCRIPT SUMMARY",
+            "=" * 60,
+        ]
+        for label, stats in (
+            ("Recently Watched Collection", stats_recent),
+            ("Change of Taste Collection", stats_change),
+        ):
+            if stats:
+                lines += [
+                    f"{label}:",
+                    f"  - Found in Plex: {stats.get('found_in_plex', 0)}",
+                    f"  - Missing in Plex: {stats.get('missing_in_plex', 0)}",
+                    f"  - Saved to JSON: {'✓' if stats.get('saved_to_json') else '✗'}",
+                    f"  - Sent to Radarr: {stats.get('sent_to_radarr', 0)}",
+                ]
+        lines += [
+            f"Total execution time: {elapsed_time:.1f} seconds",
+            "=" * 60,
+        ]
+        logger.info("\n".join(lines))
         
         # Optionally run collection refresher
         if run_refresher:
@@ -288,6 +338,9 @@ def main():
         logger.exception("Unexpected error in main execution:")
         logger.error(f"RECENTLY WATCHED COLLECTION SCRIPT END FAIL")
         return 1
+    finally:
+        from recently_watched.helpers.http_session import close_sessions
+        close_sessions()
 
 
 if __name__ == "__main__":
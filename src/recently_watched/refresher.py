@@ -20,11 +20,12 @@ Options:
 """
 
 import sys
-import json
 import random
 import argparse
 import logging
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from requests.exceptions import Timeout, ConnectionError as RequestsConnectionError
 from urllib3.exceptions import ReadTimeoutError, ConnectTimeoutError
@@ -34,9 +35,11 @@ from urllib3.exceptions import ReadTimeoutError, ConnectTimeoutError
 project_root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(project_root / "src"))
 
-from recently_watched.helpers.logger import setup_logger
+from recently_watched.helpers.logger import setup_logger, PrefixLogger
 from recently_watched.helpers.config_loader import load_config
-from recently_watched.helpers.plex_utils import library
+from recently_watched.helpers import fastjson
+from recently_watched.helpers.http_session import make_session
+from recently_watched.helpers.titles import title_key
 from plexapi.server import PlexServer
 from plexapi.exceptions import NotFound, BadRequest
 
@@ -54,12 +57,36 @@ COLLECTIONS = [
     },
 ]
 
+# Per-movie Plex lookups are independent network round-trips
+FETCH_WORKERS = 16
+
+# Go up from refresher.py -> recently_watched/ -> src/ -> project root -> data/
+_DATA_DIR = project_root / "data"
+
+# title_key -> ratingKey for the movie section, reused while the section's
+# updatedAt is unchanged so unchanged libraries skip the full listing
+LIBRARY_CACHE_PATH = _DATA_DIR / ".library_cache.json"
+
+# Keys per /library/metadata/<k1,k2,...> request; keeps URLs a sane length
+METADATA_CHUNK_SIZE = 100
+
+# Rating keys spot-checked against Plex in --dry-run
+DRY_RUN_SAMPLE_SIZE = 5
+
+# Items per collection add request
+EDIT_CHUNK_SIZE = 50
+# Items per multi-edit request when dropping the collection tag
+TAG_EDIT_CHUNK_SIZE = 100
+
+
+# json_path -> (mtime_ns, normalized entries); reparsed only when the file changes
+_json_cache = {}
+_json_cache_lock = threading.Lock()
+
 
 def load_collection_json(json_file, logger):
     """Load collection data from JSON file."""
-    # Go up from refresher.py -> recently_watched/ -> src/ -> project root -> data/
-    project_root = Path(__file__).resolve().parents[2]
-    json_path = project_root / "data" / json_file
+    json_path = _DATA_DIR / json_file
     
     logger.debug(f"Attempting to load collection from: {json_path}")
     try:
@@ -67,8 +94,15 @@ def load_collection_json(json_file, logger):
             logger.warning(f"Collection JSON file not found: {json_path}")
             return None
         
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        mtime = json_path.stat().st_mtime_ns
+        with _json_cache_lock:
+            cached = _json_cache.get(json_path)
+        if cached and cached[0] == mtime:
+            logger.debug(f"Using cached entries for {json_file}")
+            # Shared with the cache: callers must not mutate it
+            return cached[1]
+        
+        data = fastjson.loads(json_path.read_bytes())
         
         # Handle both list of dicts and list of strings
         if isinstance(data, list):
@@ -80,9 +114,11 @@ def load_collection_json(json_file, logger):
             logger.warning(f"Unexpected JSON format in {json_file}")
             return None
         
+        with _json_cache_lock:
+            _json_cache[json_path] = (mtime, result)
         logger.debug(f"Successfully loaded {len(result)} entries from {json_file}")
         return result
-    except json.JSONDecodeError as e:
+    except fastjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {json_file}: {e}")
         return None
     except Exception as e:
@@ -90,26 +126,198 @@ def load_collection_json(json_file, logger):
         return None
 
 
-def fetch_movie_by_rating_key(section, rating_key, logger):
+def build_library_maps(section, logger):
+    """
+    List the library once and return (by_key, by_title) lookup dicts,
+    so resolving collection entries is a dict probe instead of a request.
+    """
+    start_time = time.time()
+    by_key = {}
+    by_title = {}
+    for movie in section.all():
+        by_key[int(movie.ratingKey)] = movie
+        # setdefault keeps the first match, like the search-based lookup
+        by_title.setdefault(title_key(movie.title), movie)
+    elapsed = time.time() - start_time
+    logger.info(f"  ✓ Indexed {len(by_key)} library items (took {elapsed:.1f}s)")
+    return by_key, by_title
+
+
+def _section_stamp(section):
+    updated_at = getattr(section, "updatedAt", None)
+    return int(updated_at.timestamp()) if updated_at else None
+
+
+def load_library_cache(section, logger):
+    """
+    Return the saved {title_key: ratingKey} map if it was written for this
+    section at its current updatedAt, else None.
+    """
+    stamp = _section_stamp(section)
+    if stamp is None:
+        return None
+    try:
+        cache = fastjson.loads(LIBRARY_CACHE_PATH.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable library cache: {e}")
+        return None
+    if cache.get("section_id") != str(section.key) or cache.get("updated_at") != stamp:
+        return None
+    return cache.get("titles") or None
+
+
+def save_library_cache(section, by_title, logger):
+    """Persist the title -> ratingKey part of the library maps."""
+    stamp = _section_stamp(section)
+    if stamp is None:
+        return
+    try:
+        fastjson.write_file(LIBRARY_CACHE_PATH, {
+            "section_id": str(section.key),
+            "updated_at": stamp,
+            "titles": {t: int(m.ratingKey) for t, m in by_title.items()},
+        })
+    except Exception as e:
+        logger.warning(f"  Could not save library cache: {e}")
+
+
+def _parse_rating_key(value):
+    """Return value as an int ratingKey, or None if it is missing or malformed."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def fetch_movie_by_rating_key(section, rating_key, logger, by_key=None, fetch_missing=True):
     """Fetch a movie by rating key."""
+    key = _parse_rating_key(rating_key)
+    if key is None:
+        logger.debug("Ignoring malformed rating_key=%r", rating_key)
+        return None
+    if by_key is not None:
+        movie = by_key.get(key)
+        if movie or not fetch_missing:
+            return movie
     try:
-        return section.fetchItem(int(rating_key))
+        return section.fetchItem(key)
     except Exception as e:
-        logger.debug(f"Could not fetch item with rating_key={rating_key}: {e}")
+        logger.debug("Could not fetch item with rating_key=%s: %s", rating_key, e)
         return None
 
 
-def find_movie_by_title(section, title, logger):
+def find_movie_by_title(section, title, logger, by_title=None):
     """Find a movie by title (fallback if rating key not available)."""
+    title_l = title_key(title)
+    if by_title:
+        movie = by_title.get(title_l)
+        if movie:
+            return movie
     try:
-        for movie in section.search(title):
-            if movie.title.lower() == title.lower():
+        # Filter to movies server-side; non-movie matches never come back
+        for movie in section.search(title, libtype="movie"):
+            if title_key(movie.title) == title_l:
                 return movie
     except Exception as e:
-        logger.debug(f"Search failed for title={title}: {e}")
+        logger.debug("Search failed for title=%s: %s", title, e)
     return None
 
 
+def _resolve_one(section, movie_data, rating_key, logger, by_key=None, by_title=None, fetch_missing=True):
+    """Resolve one JSON entry to a Plex item: rating key first, then title."""
+    movie = None
+
+    # Try rating key first (faster)
+    if rating_key:
+        movie = fetch_movie_by_rating_key(section, rating_key, logger, by_key, fetch_missing)
+
+    # Fallback to title search
+    if not movie:
+        movie = find_movie_by_title(section, movie_data.get("title", "Unknown"), logger, by_title)
+    return movie
+
+
+def _chunked(seq, n=EDIT_CHUNK_SIZE):
+    """Yield successive n-sized slices of seq."""
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+def fetch_movies_by_rating_keys(section, keys):
+    """
+    Fetch many items by ratingKey with /library/metadata/<k1,k2,...>,
+    METADATA_CHUNK_SIZE keys per request. Returns {ratingKey: item};
+    keys Plex no longer knows are simply absent.
+    """
+    found = {}
+    chunks = list(_chunked(keys, METADATA_CHUNK_SIZE))
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        for items in ex.map(section.fetchItems, chunks):
+            for item in items:
+                found[int(item.ratingKey)] = item
+    return found
+
+
+def fetch_collection_keys(collection):
+    """
+    Return the ratingKeys of a collection's items from one raw listing,
+    without building a plexapi object per item.
+    """
+    data = collection._server.query(f"{collection.key}/children")
+    if data is None:
+        return []
+    return [int(el.attrib["ratingKey"]) for el in data if "ratingKey" in el.attrib]
+
+
+def add_items_chunked(collection, items):
+    """
+    Add items to a collection in chunks, one request per chunk.
+    Chunks are sent sequentially so Plex keeps the randomized order.
+    """
+    for chunk in _chunked(items):
+        collection.addItems(chunk)
+
+
+# batchMultiEdits() keeps pending edits on the shared section object
+_multi_edit_lock = threading.Lock()
+
+
+def remove_collection_tag_batch(section, items, collection_name: str):
+    """
+    Drop the collection tag from all items with one multi-edit request.
+    """
+    with _multi_edit_lock:
+        section.batchMultiEdits(items)
+        section.removeCollection(collection_name)
+        section.saveMultiEdits()
+
+
+def remove_collection_tag_per_item(items, collection_name: str, logger):
+    """
+    Drop the collection tag item by item (one request each).
+    """
+    if not items:
+        return
+    # Collection items share one plexapi class; probe its API once
+    has_remove = hasattr(items[0], "removeCollection")
+    has_edit_tags = hasattr(items[0], "editTags")
+    target = collection_name.lower()
+    for item in items:
+        try:
+            if has_remove:
+                item.removeCollection(collection_name)
+            elif has_edit_tags:
+                new_list = [
+                    c.tag for c in getattr(item, "collections", [])
+                    if c.tag.lower() != target
+                ]
+                item.editTags("collection", new_list, locked=False)
+        except Exception as e:
+            logger.debug("    Failed to remove %s: %s", getattr(item, "title", "Unknown"), e)
+
+
 def apply_collection_to_plex(
     plex,
     section,
@@ -117,6 +325,9 @@ def apply_collection_to_plex(
     movies: list,
     logger,
     dry_run: bool = False,
+    by_key=None,
+    by_title=None,
+    title_keys=None,
 ):
     """
     Apply collection movies to Plex by:
@@ -130,6 +341,10 @@ def apply_collection_to_plex(
         movies: List of movie dicts with 'title' and optionally 'rating_key'
         logger: Logger instance
         dry_run: If True, don't actually update Plex
+        by_key, by_title: Optional maps from build_library_maps(); lookups
+            only go to the network for entries missing from them
+        title_keys: Optional cached {title_key: ratingKey} map from
+            load_library_cache(), used for entries without a rating key
     """
     if not movies:
         logger.warning(f"  No movies to add to collection '{collection_name}'")
@@ -137,17 +352,38 @@ def apply_collection_to_plex(
     
     # Get or find collection
     collection = None
-    existing_items = []
+    existing_keys = []
     try:
         collection = section.collection(collection_name)
-        existing_items = collection.items()
-        logger.info(f"  Found existing collection with {len(existing_items)} items")
+        existing_keys = fetch_collection_keys(collection)
+        logger.info(f"  Found existing collection with {len(existing_keys)} items")
     except NotFound:
-        existing_items = []
+        existing_keys = []
         logger.info(f"  Collection '{collection_name}' not found, will create it")
     except Exception as e:
         logger.warning(f"  Could not check for existing collection: {e}")
-        existing_items = []
+        existing_keys = []
+    
+    if dry_run:
+        # Nothing is written, so skip resolving every entry; a small sample
+        # of rating keys is enough to show the JSON still matches Plex
+        logger.info(f"  DRY RUN - Would update collection '{collection_name}'")
+        logger.info(f"    Would remove {len(existing_keys)} existing items")
+        logger.info(f"    Would add up to {len(movies)} movies in randomized order")
+        sample = [
+            key for key in (
+                _parse_rating_key(m.get("rating_key"))
+                for m in movies[:DRY_RUN_SAMPLE_SIZE]
+            )
+            if key is not None
+        ]
+        if sample:
+            try:
+                found = fetch_movies_by_rating_keys(section, sample)
+                logger.info(f"    Sample check: {len(found)}/{len(sample)} rating keys found in Plex")
+            except Exception as e:
+                logger.warning(f"    Sample check failed: {e}")
+        return {"added": len(movies), "failed": 0, "filtered": 0}
     
     # Fetch movies from Plex and filter to only movies
     valid_movies = []
@@ -155,22 +391,73 @@ def apply_collection_to_plex(
     filtered_non_movies = []
     
     logger.info(f"  Fetching {len(movies)} movies from Plex...")
-    for i, movie_data in enumerate(movies, 1):
-        if i % 100 == 0 or i == len(movies):
-            logger.debug(f"    Progress: {i}/{len(movies)} fetched")
-        
-        movie = None
+    # Rating keys the library maps don't cover are fetched in bulk requests;
+    # after a successful bulk fetch a miss means the item is gone from Plex
+    known = dict(by_key) if by_key else {}
+    if title_keys:
+        # Entries without a rating key borrow one from the cached title map
+        entry_keys = [
+            m.get("rating_key") or title_keys.get(title_key(m.get("title", "")))
+            for m in movies
+        ]
+    else:
+        entry_keys = [m.get("rating_key") for m in movies]
+
+    # Partition once: keyed entries go through the bulk fetch, the rest
+    # (plus keyed misses) through title lookups on the worker pool
+    with_keys = []
+    without = []
+    for i, rating_key in enumerate(entry_keys):
+        # Missing or malformed keys fall back to a title lookup
+        key = _parse_rating_key(rating_key) if rating_key else None
+        if key is not None:
+            with_keys.append((i, key))
+        else:
+            without.append(i)
+
+    wanted = list({k for _, k in with_keys} - known.keys())
+    fetch_missing = False
+    if wanted:
+        try:
+            known.update(fetch_movies_by_rating_keys(section, wanted))
+            logger.debug(f"    Bulk-fetched {len(wanted)} rating keys")
+        except Exception as e:
+            logger.warning(f"  Bulk fetch failed, falling back to per-movie fetches: {e}")
+            fetch_missing = True
+
+    # Results are written by input index, so the randomized order survives
+    resolved = [None] * len(movies)
+    leftovers = []
+    for i, rating_key in with_keys:
+        movie = known.get(rating_key)
+        if movie:
+            resolved[i] = movie
+        else:
+            # Only retry the key itself if the bulk fetch never ran
+            leftovers.append((i, rating_key if fetch_missing else None))
+    leftovers.extend((i, None) for i in without)
+
+    if leftovers:
+        total = len(leftovers)
+        done = 0
+        done_lock = threading.Lock()
+
+        def resolve(entry):
+            nonlocal done
+            i, rating_key = entry
+            movie = _resolve_one(section, movies[i], rating_key, logger, known, by_title, fetch_missing)
+            with done_lock:
+                done += 1
+                if done % 100 == 0 or done == total:
+                    logger.debug("    Progress: %d/%d looked up", done, total)
+            return i, movie
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            for i, movie in ex.map(resolve, leftovers):
+                resolved[i] = movie
+
+    for movie_data, movie in zip(movies, resolved):
         title = movie_data.get("title", "Unknown")
-        rating_key = movie_data.get("rating_key")
-        
-        # Try rating key first (faster)
-        if rating_key:
-            movie = fetch_movie_by_rating_key(section, rating_key, logger)
-        
-        # Fallback to title search
-        if not movie:
-            movie = find_movie_by_title(section, title, logger)
-        
         if movie:
             # Filter to only movies
             item_type = getattr(movie, 'type', '').lower()
@@ -181,10 +468,10 @@ def apply_collection_to_plex(
                     'title': title,
                     'type': item_type,
                 })
-                logger.debug(f"    Filtered out non-movie: {title} (type: {item_type})")
+                logger.debug("    Filtered out non-movie: %s (type: %s)", title, item_type)
         else:
             failed_movies.append(title)
-            logger.debug(f"    Could not find movie: {title}")
+            logger.debug("    Could not find movie: %s", title)
     
     if filtered_non_movies:
         logger.info(f"  ⚠ Filtered out {len(filtered_non_movies)} non-movie items")
@@ -198,19 +485,21 @@ def apply_collection_to_plex(
     
     logger.info(f"  ✓ Found {len(valid_movies)} valid movies in Plex")
     
-    if dry_run:
-        logger.info(f"  DRY RUN - Would update collection '{collection_name}'")
-        logger.info(f"    Would remove {len(existing_items)} existing items")
-        logger.info(f"    Would add {len(valid_movies)} movies in randomized order")
-        return {"added": len(valid_movies), "failed": len(failed_movies), "filtered": len(filtered_non_movies)}
-    
     # Remove all existing items
-    if existing_items and collection:
-        logger.info(f"  Removing all {len(existing_items)} existing items...")
+    if existing_keys and collection:
+        logger.info(f"  Removing all {len(existing_keys)} existing items...")
         logger.info("    This may take a while for large collections. Please wait...")
+        existing_items = []
         try:
             start_time = time.time()
-            collection.removeItems(existing_items)
+            # The multi-edit needs item objects; one /children listing builds them
+            existing_items = collection.items()
+            try:
+                for chunk in _chunked(existing_items, TAG_EDIT_CHUNK_SIZE):
+                    remove_collection_tag_batch(section, chunk, collection_name)
+            except Exception as e:
+                logger.warning(f"  Batched tag removal failed, removing items one by one: {e}")
+                collection.removeItems(existing_items)
             elapsed = time.time() - start_time
             logger.info(f"  Remove completed in {elapsed:.1f} seconds")
         except BadRequest as e:
@@ -219,16 +508,9 @@ def apply_collection_to_plex(
             logger.info("  Attempting alternative removal method...")
             try:
                 start_time = time.time()
-                for item in existing_items:
-                    try:
-                        if hasattr(item, "removeCollection"):
-                            item.removeCollection(collection_name)
-                        elif hasattr(item, "editTags"):
-                            current = [c.tag for c in getattr(item, "collections", [])] or []
-                            new_list = [c for c in current if c.lower() != collection_name.lower()]
-                            item.editTags("collection", new_list, locked=False)
-                    except Exception as e2:
-                        logger.debug(f"    Failed to remove {getattr(item, 'title', 'Unknown')}: {e2}")
+                remove_collection_tag_per_item(
+                    existing_items or collection.items(), collection_name, logger
+                )
                 elapsed = time.time() - start_time
                 logger.info(f"  Alternative remove completed in {elapsed:.1f} seconds")
             except Exception as e2:
@@ -237,6 +519,16 @@ def apply_collection_to_plex(
         except Exception as e:
             logger.error(f"  ERROR removing items: {type(e).__name__}: {e}")
             # Continue anyway - try to add new items
+
+        # Plex may drop a collection once no item carries its tag; look it
+        # up again so the add step creates it instead of using a stale handle
+        try:
+            collection = section.collection(collection_name)
+        except NotFound:
+            logger.info(f"  Collection '{collection_name}' was removed with its last item, will recreate it")
+            collection = None
+        except Exception as e:
+            logger.warning(f"  Could not re-check collection after removal: {e}")
     
     # Add all movies in randomized order
     if not valid_movies:
@@ -281,7 +573,7 @@ def apply_collection_to_plex(
         else:
             # Add items to existing collection
             try:
-                collection.addItems(valid_movies)
+                add_items_chunked(collection, valid_movies)
                 added_count = len(valid_movies)
                 elapsed = time.time() - start_time
                 logger.info(f"  Add completed in {elapsed:.1f} seconds")
@@ -291,7 +583,7 @@ def apply_collection_to_plex(
                     logger.warning(f"  Add failed due to mixed media types, filtering...")
                     movie_only = [m for m in valid_movies if getattr(m, 'type', '').lower() == 'movie']
                     if movie_only:
-                        collection.addItems(movie_only)
+                        add_items_chunked(collection, movie_only)
                         added_count = len(movie_only)
                         elapsed = time.time() - start_time
                         logger.info(f"  Add completed with {len(movie_only)} movies in {elapsed:.1f} seconds")
@@ -311,6 +603,73 @@ def apply_collection_to_plex(
     }
 
 
+def process_collection(
+    plex,
+    section,
+    collection_config,
+    logger,
+    dry_run: bool = False,
+    by_key=None,
+    by_title=None,
+    title_keys=None,
+):
+    """
+    Load, shuffle and apply one collection from COLLECTIONS.
+    Returns the apply_collection_to_plex() stats, or None if skipped.
+    """
+    collection_name = collection_config["name"]
+    json_file = collection_config["json_file"]
+    # Collections run concurrently; prefix lines so they stay readable
+    logger = PrefixLogger(logger, {"prefix": collection_name})
+    
+    logger.info("=" * 60)
+    logger.info(f"Processing collection: {collection_name}")
+    logger.info("=" * 60)
+    
+    # Load collection JSON
+    logger.info(f"Step 3: Loading collection data from {json_file}...")
+    movies = load_collection_json(json_file, logger)
+    
+    if not movies:
+        logger.warning(f"  ⚠ Collection JSON is empty or not found - skipping '{collection_name}'")
+        return None
+    
+    if not isinstance(movies, list) or len(movies) == 0:
+        logger.warning(f"  ⚠ Collection JSON has no movies - skipping '{collection_name}'")
+        return None
+    
+    logger.info(f"  ✓ Loaded {len(movies)} movies from {json_file}")
+    
+    # Randomize order
+    logger.info("Step 4: Randomizing collection order...")
+    # sample() returns a new shuffled list and leaves the cached one intact
+    movies = random.sample(movies, len(movies))
+    logger.info(f"  ✓ Order randomized")
+    
+    # Log sample
+    sample_titles = [m.get("title", "Unknown") for m in movies[:10]]
+    logger.info(f"  First 10 movies in randomized order:")
+    for idx, title in enumerate(sample_titles, 1):
+        logger.info(f"    {idx:2d}. {title}")
+    
+    # Apply to Plex
+    logger.info(f"Step 5: Applying collection to Plex...")
+    stats = apply_collection_to_plex(
+        plex=plex,
+        section=section,
+        collection_name=collection_name,
+        movies=movies,
+        logger=logger,
+        dry_run=dry_run,
+        by_key=by_key,
+        by_title=by_title,
+        title_keys=title_keys,
+    )
+    
+    logger.info(f"  ✓ Collection update complete: {stats}")
+    return stats
+
+
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -362,8 +721,15 @@ def main():
         plex = None
         try:
             start_time = time.time()
-            # Set timeout to 30 seconds for connection
-            plex = PlexServer(config['plex']['url'], config['plex']['token'], timeout=30)
+            # Set timeout to 30 seconds for connection. The session sits on the
+            # shared keep-alive pool, unthrottled; the library section below is
+            # loaded from this server so all refresher traffic goes through it
+            plex = PlexServer(
+                config['plex']['url'],
+                config['plex']['token'],
+                session=make_session(),
+                timeout=30,
+            )
             elapsed = time.time() - start_time
             logger.info(f"  ✓ Connected to Plex server: {plex.friendlyName} (took {elapsed:.1f}s)")
         except Timeout as e:
@@ -396,7 +762,7 @@ def main():
         try:
             logger.info(f"  Loading library section: {config['plex']['movie_library_name']}...")
             start_time = time.time()
-            section = library()
+            section = plex.library.section(config['plex']['movie_library_name'])
             elapsed = time.time() - start_time
             logger.info(f"  ✓ Library section loaded: {section.title} (took {elapsed:.1f}s)")
         except Timeout as e:
@@ -410,6 +776,21 @@ def main():
             logger.error(f"  ✗ Failed to load library section: {error_type}: {e}")
             raise
         
+        # One library listing shared by every collection below, skipped
+        # entirely when the section hasn't changed since the last run
+        # (and in dry runs, which don't resolve entries)
+        by_key, by_title, title_keys = None, None, None
+        if not args.dry_run:
+            title_keys = load_library_cache(section, logger)
+            if title_keys is not None:
+                logger.info(f"  ✓ Library unchanged since last run, reusing {len(title_keys)} cached titles")
+            else:
+                try:
+                    by_key, by_title = build_library_maps(section, logger)
+                    save_library_cache(section, by_title, logger)
+                except Exception as e:
+                    logger.warning(f"  Could not index library, falling back to per-movie lookups: {e}")
+
         # Process each collection
         total_stats = {
             "collections_processed": 0,
@@ -418,56 +799,32 @@ def main():
             "total_filtered": 0,
         }
         
-        for collection_config in COLLECTIONS:
-            collection_name = collection_config["name"]
-            json_file = collection_config["json_file"]
-            
-            logger.info("=" * 60)
-            logger.info(f"Processing collection: {collection_name}")
-            logger.info("=" * 60)
-            
-            # Load collection JSON
-            logger.info(f"Step 3: Loading collection data from {json_file}...")
-            movies = load_collection_json(json_file, logger)
-            
-            if not movies:
-                logger.warning(f"  ⚠ Collection JSON is empty or not found - skipping '{collection_name}'")
-                continue
-            
-            if not isinstance(movies, list) or len(movies) == 0:
-                logger.warning(f"  ⚠ Collection JSON has no movies - skipping '{collection_name}'")
+        # Collections touch disjoint Plex collections and JSON files, so they
+        # run side by side; results are gathered in COLLECTIONS order
+        with ThreadPoolExecutor(max_workers=len(COLLECTIONS)) as ex:
+            futures = [
+                ex.submit(
+                    process_collection,
+                    plex,
+                    section,
+                    collection_config,
+                    logger,
+                    args.dry_run,
+                    by_key,
+                    by_title,
+                    title_keys,
+                )
+                for collection_config in COLLECTIONS
+            ]
+            results = [future.result() for future in futures]
+
+        for stats in results:
+            if stats is None:
                 continue
-            
-            logger.info(f"  ✓ Loaded {len(movies)} movies from {json_file}")
-            
-            # Randomize order
-            logger.info("Step 4: Randomizing collection order...")
-            random.shuffle(movies)
-            logger.info(f"  ✓ Order randomized")
-            
-            # Log sample
-            sample_titles = [m.get("title", "Unknown") for m in movies[:10]]
-            logger.info(f"  First 10 movies in randomized order:")
-            for idx, title in enumerate(sample_titles, 1):
-                logger.info(f"    {idx:2d}. {title}")
-            
-            # Apply to Plex
-            logger.info(f"Step 5: Applying collection to Plex...")
-            stats = apply_collection_to_plex(
-                plex=plex,
-                section=section,
-                collection_name=collection_name,
-                movies=movies,
-                logger=logger,
-                dry_run=args.dry_run,
-            )
-            
             total_stats["collections_processed"] += 1
             total_stats["total_added"] += stats["added"]
             total_stats["total_failed"] += stats["failed"]
             total_stats["total_filtered"] += stats["filtered"]
-            
-            logger.info(f"  ✓ Collection update complete: {stats}")
         
         # Final summary
         logger.info("=" * 60)